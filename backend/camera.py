@@ -1,4 +1,5 @@
 import logging
+import threading
 
 import cv2
 from openvino.runtime import Core
@@ -50,6 +51,55 @@ class Camera(metaclass=Singleton):
         self.release()
 
 
+class ThreadedCamera(Camera):
+    """Camera that keeps reading frames in a background thread.
+
+    Only the newest frame is kept, so inference never waits on capture and
+    always sees the latest image.
+    """
+
+    def __init__(self, device_id=None):
+        super(ThreadedCamera, self).__init__(device_id)
+        self._frame = None
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._stop = False
+        self._thread = threading.Thread(target=self._reader, daemon=True)
+        self._thread.start()
+
+    def _reader(self):
+        while not self._stop:
+            ret, frame = self.cap.read()
+            if not ret:
+                logger.error("Could not read frame")
+                break
+            with self._lock:
+                self._frame = frame
+            self._frame_ready.set()
+        self._stop = True
+        # Wake up a consumer still waiting for the first frame
+        self._frame_ready.set()
+
+    def get_frame(self):
+        logger.debug("Waiting for the latest frame from the capture thread")
+        self._frame_ready.wait()
+        with self._lock:
+            frame = self._frame
+        if self._stop or frame is None:
+            raise ValueError("Could not read frame")
+        return frame.copy()
+
+    def release(self):
+        if hasattr(self, "_thread"):
+            self._stop = True
+            if (
+                self._thread.is_alive()
+                and self._thread is not threading.current_thread()
+            ):
+                self._thread.join()
+        super(ThreadedCamera, self).release()
+
+
 def camera_decorator(device_id=None, delay=None, window_name=None):
     def decorator(process_func):
         def wrapper(*args, **kwargs):
@@ -60,9 +110,9 @@ def camera_decorator(device_id=None, delay=None, window_name=None):
                 window_name if window_name is not None else config.CAMERA_WINDOW_NAME
             )
 
-            cam = Camera(_device_id)
+            cam = ThreadedCamera(_device_id)
             try:
-                while cam.cap.isOpened():
+                while True:
                     frame = cam.get_frame()
                     processed = process_func(frame, *args, **kwargs)
                     cv2.imshow(_window_name, processed)
@@ -88,9 +138,15 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 
     ie_core = Core()
-    face_detector = FaceDetector(ie_core, config.FACE_DETECTION_MODEL_PATH)
+    ie_core.set_property({"CACHE_DIR": str(config.OPENVINO_CACHE_DIR)})
+    face_detector = FaceDetector(
+        ie_core,
+        config.FACE_DETECTION_MODEL_PATH,
+        perf_hint="LATENCY",
+        input_side=config.FACE_DET_INPUT_SIDE,
+    )
     emotions_recognizer = SmileRecognizer(
-        ie_core, config.EMOTIONS_RECOGNITION_MODEL_PATH
+        ie_core, config.EMOTIONS_RECOGNITION_MODEL_PATH, perf_hint="LATENCY"
     )
 
     @camera_decorator()
@@ -100,8 +156,8 @@ if __name__ == "__main__":
         result = face_detector.infer(input_frame)
         faces = face_detector.prepare_data(result, frame)
 
-        frame_with_emotions = frame.copy()
-
+        scored_faces = []
+        face_crops = []
         for face in faces:
             xmin = face["xmin"]
             ymin = face["ymin"]
@@ -111,14 +167,28 @@ if __name__ == "__main__":
             face_crop = frame[int(ymin) : int(ymax), int(xmin) : int(xmax)]
 
             if face_crop.size > 0:
-                emotions_input = emotions_recognizer.prepare_frame(face_crop)
-                emotions_result = emotions_recognizer.infer(emotions_input)
-                emotions_score = emotions_recognizer.score(emotions_result)
-
-                frame_with_emotions = emotions_recognizer.draw(
-                    xmin, ymin, xmax, ymax, emotions_score, frame_with_emotions
-                )
+                scored_faces.append(face)
+                face_crops.append(face_crop)
+
+        if not face_crops:
+            return frame
+
+        # Score every face of the frame with a single batched inference
+        emotions_input = emotions_recognizer.prepare_batch(face_crops)
+        emotions_result = emotions_recognizer.infer(emotions_input)
+        emotions_scores = emotions_recognizer.score_batch(emotions_result)
+
+        # The capture thread hands out a fresh frame, so draw on it directly
+        for face, emotions_score in zip(scored_faces, emotions_scores):
+            emotions_recognizer.draw(
+                face["xmin"],
+                face["ymin"],
+                face["xmax"],
+                face["ymax"],
+                emotions_score,
+                frame,
+            )
 
-        return frame_with_emotions
+        return frame
 
     process()
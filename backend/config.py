@@ -15,6 +15,39 @@ ESC_KEYCODE = 27
 FRAME_SAMPLE_INTERVAL_SECONDS = float(
     os.getenv("FRAME_SAMPLE_INTERVAL_SECONDS", "0.1")
 )
+# Video decoder: "opencv" (software), or "qsv" / "nvidia" for hardware decoding
+# through ffmpegcv when it is installed
+VIDEO_DECODER = os.getenv("VIDEO_DECODER", "opencv")
+# Worker processes running video tasks in parallel
+VIDEO_WORKER_PROCESSES = int(
+    os.getenv("VIDEO_WORKER_PROCESSES", str(max(1, (os.cpu_count() or 2) // 2)))
+)
+# Faces smaller than this many pixels are not scored
+MIN_FACE_AREA = int(os.getenv("MIN_FACE_AREA", "400"))
+# A face overlapping (IoU above SMILE_SCORE_CACHE_IOU) a face scored less than
+# SMILE_SCORE_CACHE_SECONDS ago reuses its smile score (0 seconds disables it)
+SMILE_SCORE_CACHE_SECONDS = float(os.getenv("SMILE_SCORE_CACHE_SECONDS", "0.5"))
+SMILE_SCORE_CACHE_IOU = float(os.getenv("SMILE_SCORE_CACHE_IOU", "0.9"))
+# A smile frame still waiting this many seconds for a better-scoring frame next
+# to it to be decided is dropped, so a long rising smile cannot pile up frames
+SMILE_SELECTION_MAX_PENDING_SECONDS = float(
+    os.getenv("SMILE_SELECTION_MAX_PENDING_SECONDS", "10")
+)
+# Sampled frames with faces whose crops are scored by one emotion inference
+EMOTION_BATCH_FRAMES = int(os.getenv("EMOTION_BATCH_FRAMES", "8"))
+# JPEG quality of smile frames, encoded as soon as they become candidates
+RESULT_JPEG_QUALITY = int(os.getenv("RESULT_JPEG_QUALITY", "90"))
+
+# OpenVINO inference settings
+# "THROUGHPUT" runs several CPU streams in parallel for batch video processing
+VIDEO_PERFORMANCE_HINT = os.getenv("VIDEO_PERFORMANCE_HINT", "THROUGHPUT")
+# Number of CPU streams for video processing (0 = let the hint decide)
+VIDEO_NUM_STREAMS = int(os.getenv("VIDEO_NUM_STREAMS", "0"))
+# Square face detector input side in pixels (0 = the model's native 300)
+FACE_DET_INPUT_SIDE = int(os.getenv("FACE_DET_INPUT_SIDE", "240"))
+# Number of asynchronous face detection requests kept in flight
+# (0 = the optimal number for the performance hint, i.e. one per CPU stream)
+FACE_DETECTION_NUM_REQUESTS = int(os.getenv("FACE_DETECTION_NUM_REQUESTS", "0"))
 
 # OpenVINO model names
 MODEL_NAMES = ["face-detection-retail-0005", "emotions-recognition-retail-0003"]
@@ -22,7 +55,11 @@ MODEL_NAMES = ["face-detection-retail-0005", "emotions-recognition-retail-0003"]
 # Model paths
 PROJECT_ROOT = Path(__file__).parent
 UPLOADS_DIR = Path(os.getenv("UPLOADS_DIR", "/tmp/uploads"))
-FACE_DETECTION_MODEL_PATH = str(
+# Compiled model blobs are cached here to skip graph compilation on restart
+OPENVINO_CACHE_DIR = Path(
+    os.getenv("OPENVINO_CACHE_DIR", str(PROJECT_ROOT / ".ov_cache"))
+)
+FACE_DETECTION_FP32_PATH = str(
     PROJECT_ROOT
     / "models"
     / "intel"
@@ -30,7 +67,7 @@ FACE_DETECTION_MODEL_PATH = str(
     / "FP32"
     / "face-detection-retail-0005"
 )
-EMOTIONS_RECOGNITION_MODEL_PATH = str(
+EMOTIONS_RECOGNITION_FP32_PATH = str(
     PROJECT_ROOT
     / "models"
     / "intel"
@@ -38,6 +75,40 @@ EMOTIONS_RECOGNITION_MODEL_PATH = str(
     / "FP32"
     / "emotions-recognition-retail-0003"
 )
+# INT8 models generated by quantize.py
+FACE_DETECTION_INT8_PATH = str(
+    PROJECT_ROOT
+    / "models"
+    / "intel"
+    / "face-detection-retail-0005"
+    / "INT8"
+    / "face-detection-retail-0005"
+)
+EMOTIONS_RECOGNITION_INT8_PATH = str(
+    PROJECT_ROOT
+    / "models"
+    / "intel"
+    / "emotions-recognition-retail-0003"
+    / "INT8"
+    / "emotions-recognition-retail-0003"
+)
+
+# Prefer the INT8 models when they have been generated
+USE_INT8 = os.getenv("USE_INT8", "1") == "1"
+
+
+def _select_model_path(fp32_path, int8_path):
+    if USE_INT8 and Path(int8_path + ".xml").exists():
+        return int8_path
+    return fp32_path
+
+
+FACE_DETECTION_MODEL_PATH = _select_model_path(
+    FACE_DETECTION_FP32_PATH, FACE_DETECTION_INT8_PATH
+)
+EMOTIONS_RECOGNITION_MODEL_PATH = _select_model_path(
+    EMOTIONS_RECOGNITION_FP32_PATH, EMOTIONS_RECOGNITION_INT8_PATH
+)
 
 
 # Image response format settings (base64 only)
@@ -23,6 +23,7 @@ def download_model(model_name, output_dir):
 
 
 if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from pathlib import Path
 
     import config
@@ -37,5 +38,11 @@ if __name__ == "__main__":
 
     model_names = config.MODEL_NAMES
 
-    for model_name in model_names:
-        download_model(model_name, models_dir)
+    # Each download runs in its own omz_downloader process, so run them together
+    with ThreadPoolExecutor(max_workers=len(model_names)) as executor:
+        futures = [
+            executor.submit(download_model, model_name, models_dir)
+            for model_name in model_names
+        ]
+        for future in as_completed(futures):
+            future.result()
@@ -1,9 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import project modules
 import config
-from routers import router
+from routers import router, shutdown_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_executor()
+
 
 app = FastAPI(
     title="NikoClip API",
@@ -12,6 +21,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # --- CORS SETUP ---
@@ -30,6 +40,7 @@ app.add_middleware(
 
 # --- DIRECTORY SETUP ---
 config.UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+config.OPENVINO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- ROUTER SETUP ---
 app.include_router(router)
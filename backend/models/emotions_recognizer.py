@@ -19,56 +19,95 @@ COLOR_PICKER = [
 
 
 class EmotionsRecognizer(Model):
-    def __init__(self, ie_core, model_path, device_name="CPU", num_requests=0):
+    def __init__(
+        self,
+        ie_core,
+        model_path,
+        device_name="CPU",
+        num_requests=None,
+        perf_hint="LATENCY",
+        num_streams=None,
+    ):
         super(EmotionsRecognizer, self).__init__(
             ie_core=ie_core,
             model_path=model_path,
             device_name=device_name,
             num_requests=num_requests,
+            perf_hint=perf_hint,
+            num_streams=num_streams,
+            dynamic_batch=True,
         )
 
+    def prepare_batch(self, face_crops):
+        """Resize face crops to the input size and stack them into one batch"""
+        _, c, h, w = self.input_size
+        batch = np.empty((len(face_crops), h, w, c), dtype=np.uint8)
+        for i, face_crop in enumerate(face_crops):
+            # INTER_AREA avoids aliasing when shrinking; LINEAR is fine for upscaling
+            interpolation = (
+                cv.INTER_AREA if face_crop.shape[0] > h else cv.INTER_LINEAR
+            )
+            cv.resize(face_crop, (w, h), dst=batch[i], interpolation=interpolation)
+
+        logger.debug(
+            {
+                "action": "prepare_batch",
+                "batch.shape": batch.shape,
+            }
+        )
+
+        return batch
+
     def score(self, infer_result):
         # Squeeze the inference result to get the emotion scores
         emotions_score = np.squeeze(infer_result)
         return emotions_score
 
+    def score_batch(self, infer_result):
+        # One row of emotion scores per image in the batch
+        return infer_result.reshape(infer_result.shape[0], -1)
+
     def get_color(self, emotions_score):
         """Get color from emotion score"""
-        emotion = np.argmax(emotions_score)
+        emotion = int(emotions_score.argmax())
         return COLOR_PICKER[emotion]
 
     def draw(self, xmin, ymin, xmax, ymax, emotions_score, frame, smile_mode=False):
-        # Draw rectangle on the frame based on emotion color
-        dest = frame.copy()
+        # Draw rectangle in place on the frame based on emotion color
         color = self.get_color(emotions_score)
-        cv.rectangle(
-            dest,
-            (int(xmin), int(ymin)),
-            (int(xmax), int(ymax)),
-            color=color,
-            thickness=3,
-        )
+        bbox = (int(xmin), int(ymin), int(xmax), int(ymax))
+        cv.rectangle(frame, bbox[:2], bbox[2:], color=color, thickness=3)
         logger.debug(
             {
                 "action": "draw",
-                "dest.shape": dest.shape,
+                "frame.shape": frame.shape,
             }
         )
-        return dest
+        return frame
 
 
 class SmileRecognizer(EmotionsRecognizer):
-    def __init__(self, ie_core, model_path, device_name="CPU", num_requests=0):
+    def __init__(
+        self,
+        ie_core,
+        model_path,
+        device_name="CPU",
+        num_requests=None,
+        perf_hint="LATENCY",
+        num_streams=None,
+    ):
         super(SmileRecognizer, self).__init__(
             ie_core=ie_core,
             model_path=model_path,
             device_name=device_name,
             num_requests=num_requests,
+            perf_hint=perf_hint,
+            num_streams=num_streams,
         )
 
     def get_color(self, emotions_score):
         """Get color for smile detection (yellow for smile, blue for others)"""
-        emotion = np.argmax(emotions_score)
+        emotion = int(emotions_score.argmax())
         if emotion == SMILE_INDEX:
             return COLOR_PICKER[SMILE_INDEX]
         else:
@@ -17,45 +17,61 @@ INDEX_X = 1
 INDEX_Y = 0
 BLUE = (255, 0, 0)
 
+# One record per detected face, stored as contiguous columns
+FACE_DTYPE = np.dtype(
+    [
+        ("xmin", np.int32),
+        ("ymin", np.int32),
+        ("xmax", np.int32),
+        ("ymax", np.int32),
+        ("area", np.int32),
+    ]
+)
+
 
 class FaceDetector(Model):
-    def __init__(self, ie_core, model_path, device_name="CPU", num_requests=0):
+    def __init__(
+        self,
+        ie_core,
+        model_path,
+        device_name="CPU",
+        num_requests=None,
+        perf_hint="LATENCY",
+        num_streams=None,
+        input_side=None,
+    ):
+        # A smaller square input cuts convolution cost at some accuracy loss on
+        # small faces; validate on representative footage before lowering it
         super(FaceDetector, self).__init__(
             ie_core=ie_core,
             model_path=model_path,
             device_name=device_name,
             num_requests=num_requests,
+            perf_hint=perf_hint,
+            num_streams=num_streams,
+            input_hw=(input_side, input_side) if input_side else None,
         )
 
     def prepare_data(self, input, frame, confidence=0.5):
-        data_array = []
-        for data in np.squeeze(input):
-            conf = data[INDEX_CONF]
-
-            # To avoid coordinates going out of the frame, ensure xmin/ymin are not less than 0
-            xmin = max(0, int(data[INDEX_XMIN] * frame.shape[INDEX_X]))
-            ymin = max(0, int(data[INDEX_YMIN] * frame.shape[INDEX_Y]))
+        detections = np.squeeze(input).reshape(-1, input.shape[-1])
+        detections = detections[detections[:, INDEX_CONF] > confidence]
 
-            # To keep within the frame, limit xmax/ymax to the width/height of the frame
-            xmax = min(
-                int(data[INDEX_XMAN] * frame.shape[INDEX_X]), frame.shape[INDEX_X]
-            )
-            ymax = min(
-                int(data[INDEX_YMAX] * frame.shape[INDEX_Y]), frame.shape[INDEX_Y]
-            )
-            if conf > confidence:
-                area = (xmax - xmin) * (ymax - ymin)
-                data = {
-                    "xmin": xmin,
-                    "ymin": ymin,
-                    "xmax": xmax,
-                    "ymax": ymax,
-                    "area": area,
-                }
-                data_array.append(data)
+        # Scale normalized coordinates to pixels and keep them within the frame
+        height, width = frame.shape[INDEX_Y], frame.shape[INDEX_X]
+        xmin = np.clip((detections[:, INDEX_XMIN] * width).astype(np.int32), 0, width)
+        ymin = np.clip((detections[:, INDEX_YMIN] * height).astype(np.int32), 0, height)
+        xmax = np.clip((detections[:, INDEX_XMAN] * width).astype(np.int32), 0, width)
+        ymax = np.clip((detections[:, INDEX_YMAX] * height).astype(np.int32), 0, height)
+        area = (xmax - xmin) * (ymax - ymin)
 
-                # Sort detected objects by area in descending order, so the largest is processed first
-                data_array.sort(key=lambda face: face["area"], reverse=True)
+        # Sort detected objects by area in descending order, so the largest is processed first
+        order = np.argsort(-area, kind="stable")
+        data_array = np.empty(len(order), dtype=FACE_DTYPE)
+        data_array["xmin"] = xmin[order]
+        data_array["ymin"] = ymin[order]
+        data_array["xmax"] = xmax[order]
+        data_array["ymax"] = ymax[order]
+        data_array["area"] = area[order]
         logger.debug(
             {
                 "action": "prepare_data",
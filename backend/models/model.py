@@ -1,32 +1,83 @@
 import logging
+import threading
 
-import cv2
 import numpy as np
+from openvino.preprocess import PrePostProcessor, ResizeAlgorithm
+from openvino.runtime import AsyncInferQueue, Layout, PartialShape, Type
 
 logger = logging.getLogger(__name__)
 
 
 class Model(object):
-    def __init__(self, ie_core, model_path, device_name="CPU", num_requests=0):
+    def __init__(
+        self,
+        ie_core,
+        model_path,
+        device_name="CPU",
+        num_requests=None,
+        perf_hint="LATENCY",
+        num_streams=None,
+        dynamic_batch=False,
+        input_hw=None,
+    ):
         net = ie_core.read_model(model_path + ".xml", model_path + ".bin")
 
-        self.exec_net = ie_core.compile_model(model=net, device_name=device_name)
+        # Input size expected by the network itself (N, C, H, W)
+        n, c, h, w = net.inputs[0].shape
+        if input_hw is not None:
+            h, w = input_hw
+        self.input_size = (n, c, h, w)
 
-        # Set input name, output name, input size, and output size
+        if dynamic_batch or input_hw is not None:
+            # Dynamic batch accepts any number of images per inference
+            batch = -1 if dynamic_batch else n
+            net.reshape({net.inputs[0]: PartialShape([batch, c, h, w])})
+
+        # Bake resize and u8 HWC -> f32 NCHW conversion into the graph so raw
+        # frames of any resolution can be fed directly
+        ppp = PrePostProcessor(net)
+        ppp.input().tensor().set_element_type(Type.u8).set_layout(
+            Layout("NHWC")
+        ).set_spatial_dynamic_shape()
+        ppp.input().preprocess().convert_element_type(Type.f32).resize(
+            ResizeAlgorithm.RESIZE_LINEAR
+        ).convert_layout(Layout("NCHW"))
+        ppp.input().model().set_layout(Layout("NCHW"))
+        net = ppp.build()
+
+        # LATENCY suits single-stream camera use, THROUGHPUT batch video processing
+        config_dict = {"PERFORMANCE_HINT": perf_hint}
+        if num_streams:
+            config_dict["NUM_STREAMS"] = str(num_streams)
+        self.exec_net = ie_core.compile_model(
+            model=net, device_name=device_name, config=config_dict
+        )
+
+        # Set input name, output name, and output size
         self.input_name = self.exec_net.inputs[0].get_any_name()
         self.output_name = self.exec_net.outputs[0].get_any_name()
-        self.input_size = self.exec_net.inputs[0].shape
-        self.output_size = self.exec_net.outputs[0].shape
+        self.output_size = self.exec_net.outputs[0].get_partial_shape()
+
+        # Pool of infer requests for asynchronous inference (0 = plugin optimal,
+        # None = synchronous infer() only)
+        self.infer_queue = None
+        if num_requests is not None:
+            self.infer_queue = AsyncInferQueue(self.exec_net, num_requests)
+            self.infer_queue.set_callback(self._on_infer_complete)
+        self._async_results = {}
+        self._results_ready = threading.Condition()
 
     def prepare_frame(self, frame):
-        # Resize to input size, move channel to first, and convert to 4D array
-        _, _, h, w = self.input_size
-        input_frame = cv2.resize(frame, (h, w)).transpose((2, 0, 1))[np.newaxis]
+        # share_inputs only avoids a copy for C-contiguous arrays
+        assert frame.flags["C_CONTIGUOUS"], "prepare_frame expects a contiguous frame"
+
+        # Add the batch axis; resizing and layout conversion run inside the model
+        input_frame = frame[np.newaxis]
 
         logger.debug(
             {
                 "action": "prepare_frame",
-                "input_size": (h, w),
+                "input_size": tuple(self.input_size),
                 "input_frame.shape": input_frame.shape,
             }
         )
@@ -34,9 +85,17 @@ class Model(object):
         return input_frame
 
     def infer(self, data):
+        """
+        Run synchronous inference without copying inputs or outputs.
+
+        The returned array is a view into the infer request's output buffer and
+        is overwritten by the next call, so callers must not hold on to it.
+        """
         input_data = {self.input_name: data}
 
-        infer_result = self.exec_net(input_data)[self.output_name]
+        infer_result = self.exec_net(
+            input_data, share_inputs=True, share_outputs=True
+        )[self.output_name]
 
         logger.debug(
             {
@@ -47,3 +106,40 @@ class Model(object):
         )
 
         return infer_result
+
+    def infer_async(self, data, userdata):
+        """Start inference on an idle request; the result is stored under `userdata`."""
+        # Blocks only when every request in the queue is busy
+        self.infer_queue.start_async(
+            {self.input_name: data}, userdata, share_inputs=True
+        )
+
+        logger.debug(
+            {
+                "action": "infer_async",
+                "input_data.shape": data.shape,
+                "userdata": userdata,
+            }
+        )
+
+    def wait_all(self):
+        """Block until every in-flight asynchronous request has completed."""
+        self.infer_queue.wait_all()
+
+    def wait_result(self, userdata):
+        """Block until the request started with `userdata` completes, then pop it."""
+        with self._results_ready:
+            self._results_ready.wait_for(lambda: userdata in self._async_results)
+            return self._async_results.pop(userdata)
+
+    def pop_result(self, userdata, default=None):
+        """Return and forget the asynchronous result stored under `userdata`."""
+        with self._results_ready:
+            return self._async_results.pop(userdata, default)
+
+    def _on_infer_complete(self, request, userdata):
+        # The output tensor belongs to the request and is reused by the next job
+        result = request.get_output_tensor(0).data.copy()
+        with self._results_ready:
+            self._async_results[userdata] = result
+            self._results_ready.notify_all()
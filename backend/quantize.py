@@ -0,0 +1,116 @@
+import logging
+from pathlib import Path
+
+import cv2
+import numpy as np
+from openvino.runtime import serialize
+
+logger = logging.getLogger(__name__)
+
+
+def load_calibration_frames(video_paths, num_frames):
+    """Sample up to `num_frames` frames spread evenly over the given videos."""
+    frames = []
+    frames_per_video = max(1, num_frames // len(video_paths))
+    for video_path in video_paths:
+        cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            logger.warning(f"Could not open calibration video: {video_path}")
+            continue
+
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        step = max(1, total_frames // frames_per_video)
+        for frame_number in range(0, total_frames, step)[:frames_per_video]:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = cap.read()
+            if ret:
+                frames.append(frame)
+        cap.release()
+
+    logger.info(f"Loaded {len(frames)} calibration frames")
+    return frames
+
+
+def to_model_input(image, input_size):
+    # Same resize and f32 NCHW layout the model applies to its inputs at runtime
+    _, _, h, w = input_size
+    input_frame = cv2.resize(image, (w, h)).transpose((2, 0, 1))[np.newaxis]
+    return input_frame.astype(np.float32)
+
+
+def quantize_model(ie_core, model_path, output_path, calibration_images):
+    # Only installed with the `quantize` extra, which the API server does not need
+    import nncf
+
+    logger.info(f"Start quantizing model: {model_path} to {output_path}")
+    model = ie_core.read_model(model_path + ".xml", model_path + ".bin")
+    input_size = model.inputs[0].shape
+
+    dataset = nncf.Dataset(
+        calibration_images, lambda image: to_model_input(image, input_size)
+    )
+    quantized_model = nncf.quantize(
+        model, dataset, subset_size=len(calibration_images)
+    )
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    serialize(quantized_model, output_path + ".xml", output_path + ".bin")
+    logger.info(f"Successfully quantized model: {output_path}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from openvino.runtime import Core
+
+    import config
+    from models import FaceDetector
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Quantize the OpenVINO models to INT8 with NNCF"
+    )
+    parser.add_argument("videos", nargs="+", help="Videos to take frames from")
+    parser.add_argument(
+        "--num-frames",
+        type=int,
+        default=100,
+        help="Calibration frames; about 100 are enough for both models",
+    )
+    args = parser.parse_args()
+
+    ie_core = Core()
+    frames = load_calibration_frames(args.videos, args.num_frames)
+    if not frames:
+        raise SystemExit("No calibration frames could be read")
+
+    quantize_model(
+        ie_core,
+        config.FACE_DETECTION_FP32_PATH,
+        config.FACE_DETECTION_INT8_PATH,
+        frames,
+    )
+
+    # Calibrate the emotion model on faces found by the FP32 face detector
+    face_detector = FaceDetector(ie_core, config.FACE_DETECTION_FP32_PATH)
+    face_crops = []
+    for frame in frames:
+        result = face_detector.infer(face_detector.prepare_frame(frame))
+        faces = face_detector.prepare_data(result, frame)
+        face_crops.extend(
+            face_crop
+            for face_crop in face_detector.crop(faces, frame)
+            if face_crop.size > 0
+        )
+    if not face_crops:
+        raise SystemExit("No faces found in the calibration frames")
+
+    quantize_model(
+        ie_core,
+        config.EMOTIONS_RECOGNITION_FP32_PATH,
+        config.EMOTIONS_RECOGNITION_INT8_PATH,
+        face_crops,
+    )
@@ -1,13 +1,25 @@
+import bisect
+import itertools
 import logging
+import multiprocessing
+import os
 import pathlib
+import queue
 import shutil
+import threading
 import time
 import uuid
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
 
 import cv2
-from fastapi import APIRouter, BackgroundTasks, File, HTTPException, UploadFile
+import numpy as np
+from fastapi import APIRouter, File, HTTPException, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from openvino.runtime import Core
+from pydantic import TypeAdapter
 
 # Import project modules
 import config
@@ -16,20 +28,100 @@ from models.face_detector import FaceDetector
 from schemas import TaskCreateResponse, TaskResult, TaskStatus
 from services import (ImageProcessingError, ImageService, TaskNotFoundError,
                       TaskRepository)
+from video_capture import open_video_capture
 
 logger = logging.getLogger(__name__)
 
 # Create router
 router = APIRouter()
 
+# Chunk size for copying uploads when sendfile is not available
+UPLOAD_COPY_CHUNK_SIZE = 1 << 20
+# Motion JPEG variants: seeking never has to decode from an earlier keyframe
+INTRA_ONLY_FOURCCS = {"MJPG", "JPEG", "AVRN", "DMB1"}
+
+# Total size of the serialized completed-task statuses kept for repeated
+# polling; each one carries its base64 images, so the cap is in bytes
+COMPLETED_TASK_CACHE_BYTES = 64 << 20
+
 # --- TASK STORAGE ---
-task_repository = TaskRepository()
+# Created on first use: spawned workers import this module too, and only the
+# ones that actually touch Redis should open a connection pool
+_task_repository: Optional[TaskRepository] = None
+# Serialized GET /tasks/{id} responses of completed tasks, least recently used
+# first. Results are stored once, on completion, so they never go stale.
+_completed_task_responses: "OrderedDict[str, bytes]" = OrderedDict()
+_completed_task_cache_bytes = 0
+# Serializes a whole result list in one call instead of one .dict() per result
+_RESULTS_ADAPTER = TypeAdapter(List[TaskResult])
+# Last progress percentage written for each task processed by this worker
+_reported_progress: Dict[str, int] = {}
+
+
+def _get_task_repository() -> TaskRepository:
+    global _task_repository
+    if _task_repository is None:
+        _task_repository = TaskRepository()
+    return _task_repository
+
+
+# --- VIDEO PROCESSING WORKERS ---
+# Videos are processed in separate processes so decoding and inference never
+# starve the API process. "spawn" keeps worker state independent of the server.
+# The pool is created by the first upload, so spawned workers (which import
+# this module) never start pools of their own.
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=config.VIDEO_WORKER_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _reset_executor():
+    """Drop a pool broken by a crashed worker; the next submit starts a new one."""
+    global _executor
+    broken, _executor = _executor, None
+    if broken is not None:
+        broken.shutdown(wait=False)
+
 
+def shutdown_executor():
+    if _executor is not None:
+        _executor.shutdown(wait=False)
 
-# --- MODEL INITIALIZATION (global for efficiency) ---
-ie_core = Core()
-face_detector = FaceDetector(ie_core, config.FACE_DETECTION_MODEL_PATH)
-emotions_recognizer = SmileRecognizer(ie_core, config.EMOTIONS_RECOGNITION_MODEL_PATH)
+
+# --- MODEL INITIALIZATION (lazily, once per worker process) ---
+_models: Optional[Tuple[FaceDetector, SmileRecognizer]] = None
+
+
+def _get_models() -> Tuple[FaceDetector, SmileRecognizer]:
+    global _models
+    if _models is None:
+        logger.info("Loading OpenVINO models in process %s", os.getpid())
+        ie_core = Core()
+        ie_core.set_property({"CACHE_DIR": str(config.OPENVINO_CACHE_DIR)})
+        face_detector = FaceDetector(
+            ie_core,
+            config.FACE_DETECTION_MODEL_PATH,
+            num_requests=config.FACE_DETECTION_NUM_REQUESTS,
+            perf_hint=config.VIDEO_PERFORMANCE_HINT,
+            num_streams=config.VIDEO_NUM_STREAMS,
+            input_side=config.FACE_DET_INPUT_SIDE,
+        )
+        emotions_recognizer = SmileRecognizer(
+            ie_core,
+            config.EMOTIONS_RECOGNITION_MODEL_PATH,
+            perf_hint=config.VIDEO_PERFORMANCE_HINT,
+            num_streams=config.VIDEO_NUM_STREAMS,
+        )
+        _models = (face_detector, emotions_recognizer)
+    return _models
 
 
 def select_diverse_candidates(candidates, time_threshold=1.0):
@@ -42,35 +134,134 @@ def select_diverse_candidates(candidates, time_threshold=1.0):
 
     Returns:
         A list of diverse candidates.
+
+    Videos are selected with _DiverseSmileSelector, which applies this rule
+    incrementally; the tests check it against this function.
     """
     if not candidates:
         return []
 
+    half_window = time_threshold / 2
     selected_candidates = []
-    used_time_ranges = []
+    # Timestamps of the selected candidates, kept sorted for binary search
+    used_times = []
 
     for candidate in candidates:
         candidate_time = candidate["timestamp"]
-        is_diverse = True
-        for start_time, end_time in used_time_ranges:
-            if start_time <= candidate_time <= end_time:
-                is_diverse = False
-                break
+        if _within_window(used_times, candidate_time, half_window):
+            continue
 
-        if is_diverse:
-            selected_candidates.append(candidate)
-            range_start = max(0, candidate_time - time_threshold / 2)
-            range_end = candidate_time + time_threshold / 2
-            used_time_ranges.append((range_start, range_end))
+        selected_candidates.append(candidate)
+        bisect.insort(used_times, candidate_time)
 
     return selected_candidates
 
 
+def _within_window(sorted_times: List[float], time: float, half_window: float) -> bool:
+    """Whether any of the sorted times is at most half_window away from time."""
+    index = bisect.bisect_left(sorted_times, time)
+    # Only the nearest time on either side can be inside the window
+    neighbours = sorted_times[max(0, index - 1) : index + 1]
+    return any(abs(time - other) <= half_window for other in neighbours)
+
+
+class _DiverseSmileSelector:
+    """
+    The select_diverse_candidates rule, run incrementally while a video is
+    processed: from the best score down, a candidate is selected unless a
+    selected one lies within half of `time_threshold` of it.
+
+    Frames are added in timestamp order. A candidate is settled once no later
+    frame can fall inside its window and every better-scoring candidate inside
+    it is settled: it is then either selected or dropped along with its JPEG.
+
+    A run of frames whose score keeps rising would leave all of them waiting on
+    their better neighbours, so a candidate still blocked `max_pending_seconds`
+    after it was seen is dropped. Memory thus holds the selections plus at most
+    that span of candidates. `finish` returns exactly what
+    select_diverse_candidates picks from every candidate seen unless such a run
+    outlasts the span; a dropped candidate could then have been selected had
+    the neighbour blocking it been rejected.
+    """
+
+    def __init__(self, time_threshold: float, max_pending_seconds: float):
+        self.half_window = time_threshold / 2
+        self.max_pending_seconds = max(max_pending_seconds, self.half_window)
+        # Arrival order breaks score ties like the stable sort of the full list
+        self._order = itertools.count()
+        # (-score, arrival, candidate) entries, kept sorted best first
+        self._open = []
+        self._selected = []
+
+    def add(self, candidates: List[Dict[str, object]], timestamp: float):
+        """Add one frame's candidates; no frame added later is older."""
+        if candidates:
+            # Faces of one frame share its timestamp, so once the best of them
+            # is settled the others are always dropped
+            best = max(candidates, key=lambda candidate: candidate["smile_score"])
+            bisect.insort(self._open, (-best["smile_score"], next(self._order), best))
+        self._settle(timestamp)
+
+    def finish(self) -> List[Dict[str, object]]:
+        """Settle the remaining candidates and return the selection, best first."""
+        self._settle(float("inf"))
+        self._selected.sort()
+        return [candidate for _, _, candidate in self._selected]
+
+    def _settle(self, horizon: float):
+        # Greedy selection over the open candidates only: earlier selections
+        # are more than half a window before any of them
+        selected_times = []
+        unsettled = []
+        unsettled_times = []
+        for entry in self._open:
+            time = entry[2]["timestamp"]
+            if _within_window(selected_times, time, self.half_window):
+                continue
+            blocked = _within_window(unsettled_times, time, self.half_window)
+            if not blocked and time + self.half_window < horizon:
+                self._selected.append(entry)
+                bisect.insort(selected_times, time)
+            elif blocked and time + self.max_pending_seconds < horizon:
+                # Waited too long on a better neighbour; treated as rejected
+                continue
+            else:
+                unsettled.append(entry)
+                bisect.insort(unsettled_times, time)
+        # Still sorted: entries were visited best first
+        self._open = unsettled
+
+
 def _compute_frame_skip(fps: float) -> int:
+    """
+    Number of frames between two analysed frames.
+
+    Skipped frames are only grabbed, never decoded or inferred. Smiles shorter
+    than FRAME_SAMPLE_INTERVAL_SECONDS can be missed, which is acceptable since
+    select_diverse_candidates keeps at most one scene per second anyway.
+    """
     interval_seconds = max(config.FRAME_SAMPLE_INTERVAL_SECONDS, 0)
     if interval_seconds == 0:
         return 1
-    return max(1, int(fps * interval_seconds))
+    # Round so that e.g. 29.97 fps * 0.1 s samples every 3rd frame, not every 2nd
+    return max(1, int(round(fps * interval_seconds)))
+
+
+def _is_intra_only(cap) -> bool:
+    """Whether every frame of the video decodes on its own, making seeks cheap."""
+    fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+    codec = fourcc.to_bytes(4, "little").decode("ascii", errors="replace")
+    return codec.upper() in INTRA_ONLY_FOURCCS
+
+
+def _frame_timestamp(cap, frame_number: int, fps: float) -> float:
+    """Seconds into the video of the last grabbed frame."""
+    # The container clock stays right for variable frame rate (e.g. phone) videos
+    pos_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+    if pos_msec > 0 or frame_number == 0:
+        return pos_msec / 1000.0
+    # Some backends do not report a position
+    return frame_number / fps
 
 
 def _update_task_progress(task_id: str, frame_number: int, total_frames: int) -> bool:
@@ -78,8 +269,13 @@ def _update_task_progress(task_id: str, frame_number: int, total_frames: int) ->
         return True
 
     progress = int((frame_number / total_frames) * 100)
+    # Write to Redis only when the percentage changes, not on every frame
+    if _reported_progress.get(task_id) == progress:
+        return True
+
     try:
-        task_repository.update_task(task_id, {"progress": progress})
+        _get_task_repository().update_task(task_id, {"progress": progress})
+        _reported_progress[task_id] = progress
         return True
     except TaskNotFoundError:
         logger.warning(
@@ -88,32 +284,180 @@ def _update_task_progress(task_id: str, frame_number: int, total_frames: int) ->
         return False
 
 
-def _extract_smile_candidates(
-    frame, frame_number: int, fps: float
-) -> List[Dict[str, object]]:
+def _start_face_detection(
+    face_detector: FaceDetector, task_id: str, frame, frame_number: int
+):
     input_frame = face_detector.prepare_frame(frame)
-    face_result = face_detector.infer(input_frame)
+    face_detector.infer_async(input_frame, (task_id, frame_number))
+
+
+def _box_iou(boxes_a, boxes_b):
+    """Pairwise IoU of (N, 4) and (M, 4) arrays of xmin, ymin, xmax, ymax boxes."""
+    top_left = np.maximum(boxes_a[:, None, :2], boxes_b[None, :, :2])
+    bottom_right = np.minimum(boxes_a[:, None, 2:], boxes_b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(boxes_a[:, 2:] - boxes_a[:, :2], axis=1)
+    area_b = np.prod(boxes_b[:, 2:] - boxes_b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return intersection / np.maximum(union, 1)
+
+
+class _SmileScoreCache:
+    """
+    Smile scores of recently scored face boxes.
+
+    A face overlapping a box scored less than `max_age` seconds ago with an IoU
+    above `iou_threshold` reuses that score instead of running the emotion model
+    again. Entries are not refreshed on reuse, so every face is rescored at least
+    once per `max_age` seconds.
+
+    Boxes are added when their crops are queued for the next emotion batch, with
+    the crop's slot in that batch standing in for the score until `resolve`.
+    Faces of later frames in the same batch can therefore already match them.
+    """
+
+    def __init__(self, max_age: float, iou_threshold: float):
+        self.max_age = max_age
+        self.iou_threshold = iou_threshold
+        self._boxes = np.empty((0, 4), dtype=np.float32)
+        self._scores = np.empty(0, dtype=np.float32)
+        self._slots = np.empty(0, dtype=np.int64)
+        self._timestamps = np.empty(0, dtype=np.float64)
+
+    def lookup(self, boxes, timestamp: float):
+        """
+        Match boxes against the cache.
+
+        Returns:
+            (scores, slots): the cached score of each box, NaN where none applies,
+            and the batch slot of boxes matching a still unscored entry, else -1
+        """
+        fresh = timestamp - self._timestamps < self.max_age
+        self._boxes = self._boxes[fresh]
+        self._scores = self._scores[fresh]
+        self._slots = self._slots[fresh]
+        self._timestamps = self._timestamps[fresh]
+
+        scores = np.full(len(boxes), np.nan, dtype=np.float32)
+        slots = np.full(len(boxes), -1, dtype=np.int64)
+        if len(boxes) and len(self._boxes):
+            iou = _box_iou(boxes, self._boxes)
+            best = iou.argmax(axis=1)
+            hit = iou[np.arange(len(boxes)), best] > self.iou_threshold
+            scores[hit] = self._scores[best[hit]]
+            slots[hit] = self._slots[best[hit]]
+        return scores, slots
+
+    def add(self, boxes, slots, timestamp: float):
+        """Add boxes queued for scoring in the given slots of the next batch."""
+        self._boxes = np.concatenate([self._boxes, boxes])
+        self._scores = np.concatenate(
+            [self._scores, np.full(len(boxes), np.nan, dtype=np.float32)]
+        )
+        self._slots = np.concatenate([self._slots, slots])
+        self._timestamps = np.concatenate(
+            [self._timestamps, np.full(len(boxes), timestamp)]
+        )
+
+    def resolve(self, batch_scores):
+        """Fill in the scores of the boxes queued for the batch just scored."""
+        queued = self._slots >= 0
+        self._scores[queued] = batch_scores[self._slots[queued]]
+        self._slots[queued] = -1
+
+
+def _collect_scene(
+    face_detector: FaceDetector,
+    score_cache: _SmileScoreCache,
+    task_id: str,
+    frame,
+    frame_number: int,
+    timestamp: float,
+    face_crops: List,
+) -> Optional[Dict[str, object]]:
+    """
+    Wait for the face detection of a frame and queue its unscored face crops.
+
+    Returns:
+        The frame with the cached score and batch slot of each face, or None
+        when the frame has no face worth scoring
+    """
+    face_result = face_detector.wait_result((task_id, frame_number))
     faces = face_detector.prepare_data(face_result, frame)
+    # Tiny faces cannot be classified reliably; do not spend inference on them
+    faces = faces[faces["area"] >= config.MIN_FACE_AREA]
+    if len(faces) == 0:
+        return None
 
-    candidates: List[Dict[str, object]] = []
-    timestamp = frame_number / fps if fps else 0.0
+    boxes = np.stack(
+        [faces["xmin"], faces["ymin"], faces["xmax"], faces["ymax"]], axis=1
+    ).astype(np.float32)
+    smile_scores, slots = score_cache.lookup(boxes, timestamp)
 
-    for face in faces:
+    # Queue only faces without a recent or already queued matching box
+    queued_indices = []
+    for index in np.flatnonzero(np.isnan(smile_scores) & (slots < 0)):
+        face = faces[index]
         face_crop = frame[face["ymin"] : face["ymax"], face["xmin"] : face["xmax"]]
         if face_crop.size == 0:
             continue
+        slots[index] = len(face_crops)
+        queued_indices.append(index)
+        face_crops.append(face_crop)
+    score_cache.add(boxes[queued_indices], slots[queued_indices], timestamp)
+
+    return {
+        "frame": frame,
+        "timestamp": timestamp,
+        "smile_scores": smile_scores,
+        "slots": slots,
+    }
+
+
+def _score_face_crops(emotions_recognizer: SmileRecognizer, face_crops: List):
+    """
+    Smile score of every queued face crop, from a single batched inference.
+
+    The scoring thread needs the scores before it can go on, so the batch runs
+    synchronously; the face detector keeps the other CPU streams busy.
+    """
+    if not face_crops:
+        return np.empty(0, dtype=np.float32)
 
-        emotions_input = emotions_recognizer.prepare_frame(face_crop)
-        emotions_result = emotions_recognizer.infer(emotions_input)
-        emotions_score = emotions_recognizer.score(emotions_result)
-        smile_score = emotions_score[SMILE_INDEX]
+    emotions_result = emotions_recognizer.infer(
+        emotions_recognizer.prepare_batch(face_crops)
+    )
+    # infer() returns the request's output buffer, reused by the next batch
+    return emotions_recognizer.score_batch(emotions_result)[:, SMILE_INDEX].copy()
+
+
+def _scene_smile_candidates(
+    scene: Dict[str, object], batch_scores
+) -> List[Dict[str, object]]:
+    smile_scores = scene["smile_scores"]
+    slots = scene["slots"]
+    queued = slots >= 0
+    smile_scores[queued] = batch_scores[slots[queued]]
+
+    # Encoded lazily, once per frame, and only when a face passes the threshold.
+    # A JPEG is 10-20x smaller than the raw BGR frame kept until finalization.
+    frame_jpg = None
 
+    candidates: List[Dict[str, object]] = []
+    for smile_score in smile_scores:
+        # NaN (empty crop) never passes the threshold
         if smile_score > 0.6:
+            if frame_jpg is None:
+                frame_jpg = cv2.imencode(
+                    ".jpg",
+                    scene["frame"],
+                    [cv2.IMWRITE_JPEG_QUALITY, config.RESULT_JPEG_QUALITY],
+                )[1]
             candidates.append(
                 {
                     "smile_score": float(smile_score),
-                    "timestamp": timestamp,
-                    "frame": frame.copy(),
+                    "timestamp": scene["timestamp"],
+                    "frame_jpg": frame_jpg,
                 }
             )
 
@@ -125,13 +469,10 @@ def _create_task_result(
 ) -> Optional[TaskResult]:
     image_filename = f"scene_{index + 1}.jpg"
     timestamp_str = f'{candidate["timestamp"]:.2f}s'
-    temp_image_path = pathlib.Path(f"temp_{task_id}_{image_filename}")
-
-    cv2.imwrite(str(temp_image_path), candidate["frame"])
 
     try:
-        task_result = ImageService.create_task_result_with_fallback(
-            image_path=temp_image_path,
+        task_result = ImageService.create_task_result_from_bytes(
+            image_data=candidate["frame_jpg"],
             timestamp=timestamp_str,
             score=candidate["smile_score"],
             task_id=task_id,
@@ -154,35 +495,29 @@ def _create_task_result(
                 exc_info=True,
             )
         return None
-    finally:
-        if temp_image_path.exists():
-            temp_image_path.unlink()
 
 
-def _finalize_smile_results(task_id: str, smile_candidates: List[Dict[str, object]]):
-    if not smile_candidates:
+def _finalize_smile_results(task_id: str, top_smiles: List[Dict[str, object]]):
+    if not top_smiles:
         try:
-            task_repository.append_task_results(task_id, [])
-            task_repository.update_task(task_id, {"status": "complete"})
+            _get_task_repository().append_task_results(task_id, [])
+            _get_task_repository().update_task(task_id, {"status": "complete"})
         except TaskNotFoundError:
             logger.warning(
                 "Task %s no longer exists while finalizing empty results", task_id
             )
         return
 
-    smile_candidates.sort(key=lambda candidate: candidate["smile_score"], reverse=True)
-    top_smiles = select_diverse_candidates(smile_candidates, time_threshold=1.0)
-
     final_results: List[TaskResult] = []
     for index, candidate in enumerate(top_smiles):
         task_result = _create_task_result(task_id, candidate, index)
         if task_result:
             final_results.append(task_result)
 
-    results_payload = [result.dict() for result in final_results]
+    results_payload = _RESULTS_ADAPTER.dump_python(final_results, mode="json")
     try:
-        task_repository.append_task_results(task_id, results_payload)
-        task_repository.update_task(
+        _get_task_repository().append_task_results(task_id, results_payload)
+        _get_task_repository().update_task(
             task_id, {"status": "complete", "progress": 100}
         )
     except TaskNotFoundError:
@@ -193,7 +528,7 @@ def _finalize_smile_results(task_id: str, smile_candidates: List[Dict[str, objec
 
 def _handle_processing_exception(task_id: str, error: Exception):
     try:
-        task_repository.update_task(
+        _get_task_repository().update_task(
             task_id,
             {
                 "status": "error",
@@ -206,6 +541,42 @@ def _handle_processing_exception(task_id: str, error: Exception):
         )
 
 
+def _on_task_done(task_id: str, video_path: str, future):
+    """Record tasks whose worker died before process_video_task could."""
+    if future.cancelled() or future.exception() is None:
+        return
+    error = future.exception()
+    logger.error("Video task %s was lost with its worker: %s", task_id, error)
+    _handle_processing_exception(task_id, error)
+    _cleanup_video_file(video_path)
+
+
+def _save_upload(source, destination: pathlib.Path):
+    """Copy an uploaded file to disk; runs in a worker thread."""
+    with destination.open("wb") as buffer:
+        in_fd = None
+        # fileno() would force a SpooledTemporaryFile still held in memory to
+        # roll over to disk, so only ask for it once the spool has rolled
+        if getattr(source, "_rolled", True):
+            try:
+                in_fd = source.fileno()
+            except (AttributeError, OSError):
+                in_fd = None
+
+        if in_fd is not None and hasattr(os, "sendfile"):
+            # Let the kernel copy the spooled upload without a userspace buffer
+            offset = source.tell()
+            remaining = os.fstat(in_fd).st_size - offset
+            while remaining > 0:
+                sent = os.sendfile(buffer.fileno(), in_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        else:
+            shutil.copyfileobj(source, buffer, length=UPLOAD_COPY_CHUNK_SIZE)
+
+
 def _cleanup_video_file(video_path: str):
     video = pathlib.Path(video_path)
     if video.exists():
@@ -217,13 +588,29 @@ def process_video_task(task_id: str, video_path: str):
     Processes a video file to find diverse, high-quality smile scenes and
     updates the task status with progress. Results are returned in base64 format.
 
+    Frames are decoded and sent to face detection on this thread while a scoring
+    thread post-processes finished detections and runs the emotion model.
+
     Args:
         task_id: Unique identifier for the task
         video_path: Path to the video file to process
     """
     cap = None
+    scorer = None
+    # Frames whose face detection is in flight, oldest first:
+    # (frame, frame_number, timestamp).
+    # None tells the scoring thread that decoding is over.
+    pending = None
+    # Set when the scoring thread should only drop the detections it receives
+    stop_scoring = threading.Event()
+    scoring_errors = []
     try:
-        cap = cv2.VideoCapture(video_path)
+        face_detector, emotions_recognizer = _get_models()
+        # Hardware decoders drop unsampled frames before they leave ffmpeg and
+        # then report the sampling rate, which makes frame_skip 1
+        interval_seconds = config.FRAME_SAMPLE_INTERVAL_SECONDS
+        sample_fps = 1.0 / interval_seconds if interval_seconds > 0 else None
+        cap = open_video_capture(video_path, sample_fps=sample_fps)
         if not cap.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
 
@@ -233,11 +620,79 @@ def process_video_task(task_id: str, video_path: str):
             fps = 30  # Assume 30 FPS if not available
 
         frame_skip = _compute_frame_skip(fps)
-
-        smile_candidates = []
+        # Frames between two sampled ones are either grabbed (cheap, but still
+        # demuxed and decoded) or, for intra-only codecs, seeked over
+        seek_to_samples = frame_skip > 1 and _is_intra_only(cap)
+        frame_step = frame_skip if seek_to_samples else 1
+        # Keep every detector request (one per CPU stream) busy
+        pending = queue.Queue(maxsize=len(face_detector.infer_queue))
+
+        smile_selector = _DiverseSmileSelector(
+            time_threshold=1.0,
+            max_pending_seconds=config.SMILE_SELECTION_MAX_PENDING_SECONDS,
+        )
+        score_cache = _SmileScoreCache(
+            config.SMILE_SCORE_CACHE_SECONDS, config.SMILE_SCORE_CACHE_IOU
+        )
         frame_number = 0
 
-        while cap.isOpened():
+        # Frames waiting for the next emotion batch and the face crops it scores
+        scenes = []
+        face_crops = []
+
+        def score_scenes():
+            batch_scores = _score_face_crops(emotions_recognizer, face_crops)
+            score_cache.resolve(batch_scores)
+            for scene in scenes:
+                smile_selector.add(
+                    _scene_smile_candidates(scene, batch_scores), scene["timestamp"]
+                )
+            scenes.clear()
+            face_crops.clear()
+
+        def score_pending_frames():
+            try:
+                while (item := pending.get()) is not None:
+                    frame, pending_number, timestamp = item
+                    if stop_scoring.is_set():
+                        # Drop the result of a detection abandoned by an early exit
+                        face_detector.wait_result((task_id, pending_number))
+                        continue
+
+                    scene = _collect_scene(
+                        face_detector,
+                        score_cache,
+                        task_id,
+                        frame,
+                        pending_number,
+                        timestamp,
+                        face_crops,
+                    )
+                    if scene is not None:
+                        scenes.append(scene)
+                        # One emotion inference covers the faces of several frames
+                        if len(scenes) >= config.EMOTION_BATCH_FRAMES:
+                            score_scenes()
+
+                if not stop_scoring.is_set():
+                    score_scenes()
+            except Exception as exc:
+                scoring_errors.append(exc)
+                stop_scoring.set()
+                # Keep draining so the decoding thread never blocks on a full queue
+                dropped = []
+                while (item := pending.get()) is not None:
+                    dropped.append(item[1])
+                face_detector.wait_all()
+                for dropped_number in dropped:
+                    face_detector.pop_result((task_id, dropped_number))
+
+        scorer = threading.Thread(target=score_pending_frames, daemon=True)
+        scorer.start()
+
+        while cap.isOpened() and not stop_scoring.is_set():
+            if seek_to_samples and frame_number > 0:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
             if not cap.grab():
                 break
 
@@ -250,19 +705,36 @@ def process_video_task(task_id: str, video_path: str):
                 if not ret:
                     logger.warning("Failed to retrieve frame %s", frame_number)
                 else:
-                    smile_candidates.extend(
-                        _extract_smile_candidates(frame, frame_number, fps)
+                    # Read the timestamp first: nothing may raise between
+                    # starting the detection and queueing it, or its result
+                    # would never be collected
+                    timestamp = _frame_timestamp(cap, frame_number, fps)
+                    # Blocks only while the scoring thread is behind by a full
+                    # pipeline of in-flight detections
+                    _start_face_detection(
+                        face_detector, task_id, frame, frame_number
                     )
+                    pending.put((frame, frame_number, timestamp))
+
+            frame_number += frame_step
 
-            frame_number += 1
+        pending.put(None)
+        scorer.join()
+        if scoring_errors:
+            raise scoring_errors[0]
 
-        _finalize_smile_results(task_id, smile_candidates)
+        _finalize_smile_results(task_id, smile_selector.finish())
 
     except Exception as exc:
         _handle_processing_exception(task_id, exc)
     finally:
+        if scorer is not None and scorer.is_alive():
+            stop_scoring.set()
+            pending.put(None)
+            scorer.join()
         if cap is not None:
             cap.release()
+        _reported_progress.pop(task_id, None)
         _cleanup_video_file(video_path)
 
 
@@ -273,17 +745,21 @@ async def health():
 
 
 @router.post("/tasks", response_model=TaskCreateResponse)
-async def create_task(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+async def create_task(file: UploadFile = File(...)):
     """Create a new video processing task."""
     task_id = str(uuid.uuid4())
     config.UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
     upload_path = config.UPLOADS_DIR / f"{task_id}_{file.filename}"
 
-    with upload_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    # Copy off the event loop so large uploads do not stall other requests
+    try:
+        await run_in_threadpool(_save_upload, file.file, upload_path)
+    finally:
+        await file.close()
 
-    # Initialize task with progress 0
-    task_repository.create_task(
+    # Initialize task with progress 0; the Redis round trip stays off the loop too
+    await run_in_threadpool(
+        _get_task_repository().create_task,
         task_id,
         {
             "filename": file.filename,
@@ -292,23 +768,71 @@ async def create_task(background_tasks: BackgroundTasks, file: UploadFile = File
         },
     )
 
-    background_tasks.add_task(process_video_task, task_id, str(upload_path))
+    video_path = str(upload_path)
+    try:
+        future = _get_executor().submit(process_video_task, task_id, video_path)
+    except BrokenProcessPool:
+        # A worker died and took the whole pool down with it
+        logger.warning("Video worker pool is broken, starting a new one")
+        _reset_executor()
+        future = _get_executor().submit(process_video_task, task_id, video_path)
+    future.add_done_callback(lambda done: _on_task_done(task_id, video_path, done))
 
     return TaskCreateResponse(task_id=task_id, status="processing")
 
 
+def _cache_completed_task_response(task_id: str, content: bytes):
+    """Cache a completed task's response, evicting the least recently used."""
+    global _completed_task_cache_bytes
+
+    if len(content) > COMPLETED_TASK_CACHE_BYTES:
+        return
+    _evict_completed_task_response(task_id)
+    _completed_task_responses[task_id] = content
+    _completed_task_cache_bytes += len(content)
+    while _completed_task_cache_bytes > COMPLETED_TASK_CACHE_BYTES:
+        _, evicted = _completed_task_responses.popitem(last=False)
+        _completed_task_cache_bytes -= len(evicted)
+
+
+def _evict_completed_task_response(task_id: str):
+    global _completed_task_cache_bytes
+
+    evicted = _completed_task_responses.pop(task_id, None)
+    if evicted is not None:
+        _completed_task_cache_bytes -= len(evicted)
+
+
 @router.get("/tasks/{task_id}", response_model=TaskStatus)
 async def get_task(task_id: str):
     """Get task status and results (base64 format only)."""
+    cached_response = _completed_task_responses.get(task_id)
+    if cached_response is not None:
+        # Skip fetching and serializing the results again; only expiry matters
+        if await run_in_threadpool(_get_task_repository().task_exists, task_id):
+            # Concurrent requests may have evicted the entry during the await
+            if task_id in _completed_task_responses:
+                _completed_task_responses.move_to_end(task_id)
+            return Response(content=cached_response, media_type="application/json")
+        _evict_completed_task_response(task_id)
+        raise HTTPException(status_code=404, detail="Task not found")
+
     try:
-        task = task_repository.get_task(task_id)
+        task = await run_in_threadpool(_get_task_repository().get_task, task_id)
     except TaskNotFoundError:
         raise HTTPException(status_code=404, detail="Task not found")
 
     # Convert results to Pydantic models if they exist
     if task.get("results") and isinstance(task["results"], list):
         if task["results"] and isinstance(task["results"][0], dict):
-            # Convert dict results to TaskResult objects
-            task["results"] = [TaskResult(**result) for result in task["results"]]
+            # Results were validated as TaskResult before they were stored
+            task["results"] = [
+                TaskResult.model_construct(**result) for result in task["results"]
+            ]
+
+    # Serialize here so the response model is not validated a second time
+    content = TaskStatus.model_construct(**task).model_dump_json()
+    if task.get("status") == "complete":
+        _cache_completed_task_response(task_id, content.encode())
 
-    return TaskStatus(**task)
+    return Response(content=content, media_type="application/json")
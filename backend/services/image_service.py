@@ -2,16 +2,387 @@
 ImageService for handling base64 image encoding and validation.
 """
 
+import asyncio
 import base64
 import logging
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import MAX_BASE64_IMAGE_SIZE_MB
 from schemas import TaskResult
 
+try:
+    # SIMD (AVX2/SSSE3) base64 encoder, several times faster on large images
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 logger = logging.getLogger(__name__)
 
+# Bytes read per step when encoding a file; a multiple of 3 so that no chunk
+# but the last produces base64 padding
+BASE64_FILE_CHUNK_SIZE = 3 * 1024 * 1024
+# Worker threads for create_task_result_with_fallback_async; started on first
+# use. pybase64 releases the GIL while encoding, so encodes run in parallel.
+_BASE64_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="base64"
+)
+# Bytes read to identify an image format by its magic number
+IMAGE_HEADER_SIZE = 12
+# Files at least this large are memory-mapped instead of read into a buffer;
+# below it the mapping setup costs more than the copy it saves
+BASE64_MMAP_MIN_SIZE = 1 << 20
+# O_CLOEXEC exists only on POSIX, O_BINARY only on Windows
+_OPEN_READ_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+# should_use_base64 decisions, with the MIME type found by the probe, kept
+# least recently used first. They are keyed by (path, mtime_ns, size,
+# force_fallback), so a changed file is inspected again.
+BASE64_DECISION_CACHE_SIZE = 4096
+_base64_decisions: "OrderedDict[tuple, Tuple[Dict[str, Any], Optional[str]]]" = (
+    OrderedDict()
+)
+# Decisions are made on the API threads and the base64 executor alike
+_base64_decisions_lock = threading.Lock()
+
+
+# Extensions accepted by validate_image_file; the MIME type always comes from
+# the file's magic number (_detect_image_mime)
+SUPPORTED_IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
+)
+
+
+# Messages shown to users for each ImageProcessingError code
+USER_ERROR_MESSAGES = {
+    "BASE64_ENCODING_ERROR": {
+        "message": "An error occurred while processing the image.",
+        "suggestion": "Try a different image or wait and retry later.",
+        "retryable": True,
+    },
+    "IMAGE_SIZE_ERROR": {
+        "message": f"The image file is too large (limit: {MAX_BASE64_IMAGE_SIZE_MB}MB).",
+        "suggestion": "Use a smaller image or compress the file.",
+        "retryable": False,
+    },
+    "IMAGE_VALIDATION_ERROR": {
+        "message": "The image format is not supported.",
+        "suggestion": "Use JPEG, PNG, GIF, BMP, or WebP image formats.",
+        "retryable": False,
+    },
+    "FALLBACK_FAILED": {
+        "message": "Image processing failed.",
+        "suggestion": "Check that the image file is not corrupted and try again.",
+        "retryable": True,
+    },
+    "ALL_FALLBACKS_FAILED": {
+        "message": "Unable to process the image.",
+        "suggestion": "Use another image or contact support.",
+        "retryable": False,
+    },
+}
+DEFAULT_USER_ERROR_MESSAGE = {
+    "message": "An unexpected error occurred.",
+    "suggestion": "Wait a while and try again.",
+    "retryable": True,
+}
+
+
+def _extension(image_path) -> str:
+    """Lowercase extension of a str or Path, like Path.suffix.lower()."""
+    return os.path.splitext(image_path)[1].lower()
+
+
+def _detect_image_mime(header: bytes) -> Optional[str]:
+    """MIME type from the first IMAGE_HEADER_SIZE bytes, None if not an image."""
+    if header[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    if header[:2] == b"BM":
+        return "image/bmp"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _read_image_mime(fd: int, size: int) -> Optional[str]:
+    """Image MIME type from the header at fd's offset; None if there is none."""
+    if size == 0:
+        return None
+    try:
+        return _detect_image_mime(os.read(fd, IMAGE_HEADER_SIZE))
+    except OSError:
+        return None
+
+
+def _probe_image_mime(image_path, size: int) -> Optional[str]:
+    """Open a file just to read its header, see _read_image_mime."""
+    if size == 0:
+        return None
+    try:
+        fd = os.open(image_path, _OPEN_READ_FLAGS)
+    except OSError:
+        return None
+    try:
+        return _read_image_mime(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _inspect(image_path: Path) -> Optional[os.stat_result]:
+    """stat() a file once so its result can be shared; None if it does not exist."""
+    try:
+        return os.stat(image_path)
+    except FileNotFoundError:
+        return None
+
+
+def _b64encode(data) -> bytes:
+    if pybase64 is not None:
+        return pybase64.b64encode(data)
+    return base64.b64encode(data)
+
+
+def _encode_file_to_base64_streaming(
+    image_path: Path, chunk_size: int = BASE64_FILE_CHUNK_SIZE
+) -> str:
+    """
+    Encode an image file to a base64 data URI one chunk at a time.
+
+    The file is read through a raw descriptor: no BufferedReader, no isatty
+    call. The MIME type comes from the file's magic number.
+
+    Raises:
+        ImageValidationError: If the file is empty or not a supported image
+    """
+    fd = os.open(image_path, _OPEN_READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        mime_type = _read_image_mime(fd, size)
+        if mime_type is None:
+            raise ImageValidationError(
+                f"Image file {image_path} is not a supported image"
+            )
+        # Rewind past the header; the mmap path maps from offset 0 anyway
+        os.lseek(fd, 0, os.SEEK_SET)
+        return _encode_fd_to_base64(fd, size, mime_type, chunk_size)
+    finally:
+        os.close(fd)
+
+
+def _encode_fd_to_base64(
+    fd: int, size: int, mime_type: str, chunk_size: int = BASE64_FILE_CHUNK_SIZE
+) -> str:
+    """
+    Encode an open file, read from its current offset, to a base64 data URI.
+
+    The encoded text is written into one preallocated buffer, so besides the
+    result only a single chunk of the file is held in memory. Large files are
+    memory-mapped and encoded straight from the page cache.
+    """
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    out = bytearray(len(prefix) + (size + 2) // 3 * 4)
+    out[: len(prefix)] = prefix
+    position = len(prefix)
+
+    def append_encoded(data):
+        nonlocal position
+        encoded = _b64encode(data)
+        out[position : position + len(encoded)] = encoded
+        position += len(encoded)
+
+    if size >= BASE64_MMAP_MIN_SIZE:
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+            # The view must be released before the mapping can be closed
+            with memoryview(mapped) as view:
+                for offset in range(0, size, chunk_size):
+                    append_encoded(view[offset : offset + chunk_size])
+    else:
+        # Bytes of a short read that do not fill a 3-byte group yet
+        carry = b""
+        while chunk := os.read(fd, chunk_size):
+            if carry:
+                chunk = carry + chunk
+            usable = len(chunk) - len(chunk) % 3
+            append_encoded(memoryview(chunk)[:usable])
+            carry = chunk[usable:]
+        append_encoded(carry)
+
+    # The file may have shrunk since fstat(); drop the unused tail
+    del out[position:]
+    return out.decode("ascii")
+
+
+def _format_fallback_attempts(attempts: List[Tuple[str, object]]) -> str:
+    return "; ".join(f"{step}: {reason}" for step, reason in attempts)
+
+
+def _cached_base64_decision(
+    path_str: str, stat_result: os.stat_result, force_fallback: bool, probe_mime
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    _base64_decision for a file the caller has already stat()ed, cached.
+
+    The size comes from the caller's stat, so a miss costs no second stat.
+    Only `probe_mime`, which returns the MIME type read from the file's header
+    or None, touches the file; its result serves as the readability check.
+
+    Returns:
+        (the shared cached decision dict, the detected MIME type or None)
+    """
+    key = (path_str, stat_result.st_mtime_ns, stat_result.st_size, force_fallback)
+    with _base64_decisions_lock:
+        cached = _base64_decisions.get(key)
+        if cached is not None:
+            _base64_decisions.move_to_end(key)
+            return cached
+
+    mime_type = None
+
+    def is_readable():
+        nonlocal mime_type
+        mime_type = probe_mime()
+        return mime_type is not None
+
+    decision = _base64_decision(
+        path_str, stat_result.st_size, force_fallback, is_readable
+    )
+    cached = (decision, mime_type)
+    with _base64_decisions_lock:
+        _base64_decisions[key] = cached
+        if len(_base64_decisions) > BASE64_DECISION_CACHE_SIZE:
+            _base64_decisions.popitem(last=False)
+    return cached
+
+
+def _encode_if_suitable(
+    image_path: Path, force_fallback: bool = False
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Make the should_use_base64 decision and encode the file in one pass.
+
+    One descriptor serves the stat, the readability probe and the encoding, so
+    the file is opened once instead of twice. The decision goes through the
+    same cache as should_use_base64; a hit skips the probe read. The MIME type
+    comes from the file's magic number, so mislabeled or non-image files are
+    caught.
+
+    Returns:
+        (data URI or None when base64 is not suitable, decision dict)
+
+    Raises:
+        Base64EncodingError: If encoding fails
+    """
+    path_str = os.fspath(image_path)
+    try:
+        fd = os.open(path_str, _OPEN_READ_FLAGS)
+    except OSError:
+        # Reported as an invalid file, like a missing file
+        return None, _base64_decision(path_str, None, force_fallback, None)
+
+    try:
+        stat_result = os.fstat(fd)
+        # The probe reads through the descriptor that is encoded below
+        cached_decision, mime_type = _cached_base64_decision(
+            path_str,
+            stat_result,
+            force_fallback,
+            lambda: _read_image_mime(fd, stat_result.st_size),
+        )
+        decision = dict(cached_decision)
+        if not decision["use_base64"]:
+            return None, decision
+
+        try:
+            # Rewind past the probe; the mmap path maps from offset 0 anyway
+            os.lseek(fd, 0, os.SEEK_SET)
+            image_data = _encode_fd_to_base64(fd, stat_result.st_size, mime_type)
+        except Exception as e:
+            logger.error(f"Failed to encode image {image_path} to base64: {str(e)}")
+            raise Base64EncodingError(f"Base64 encoding failed: {str(e)}", e) from e
+        return image_data, decision
+    finally:
+        os.close(fd)
+
+
+def _base64_decision(
+    image_path, file_size: Optional[int], force_fallback: bool, is_readable
+) -> Dict[str, Any]:
+    """
+    Decide whether an image should be base64 encoded, see should_use_base64.
+
+    `file_size` is None for a missing file. `is_readable` is called last, only
+    for files that pass every other check.
+    """
+    result = {
+        "use_base64": False,
+        "reason": "unknown",
+        "file_size_mb": 0.0,
+        "error": None,
+    }
+
+    try:
+        # Cheap checks first: existence and extension need no file access
+        if (
+            file_size is None
+            or _extension(image_path) not in SUPPORTED_IMAGE_EXTENSIONS
+        ):
+            result["reason"] = "invalid_file"
+            result["error"] = f"Image file {image_path} is not valid or accessible"
+            logger.error(result["error"])
+            return result
+
+        # Check file size
+        size_mb = file_size / (1024 * 1024)
+        result["file_size_mb"] = size_mb
+
+        if force_fallback:
+            result["reason"] = "forced_fallback"
+            logger.info("Forced fallback to URL format for %s", image_path)
+            return result
+
+        if size_mb > MAX_BASE64_IMAGE_SIZE_MB:
+            result["reason"] = "size_limit_exceeded"
+            logger.warning(
+                "Image %s (%.2fMB) exceeds max base64 size (%sMB), "
+                "falling back to URL format",
+                image_path,
+                size_mb,
+                MAX_BASE64_IMAGE_SIZE_MB,
+            )
+            return result
+
+        # Open the file only once it would actually be encoded
+        if not is_readable():
+            result["reason"] = "invalid_file"
+            result["error"] = f"Image file {image_path} is not valid or accessible"
+            logger.error(result["error"])
+            return result
+
+        # All checks passed
+        result["use_base64"] = True
+        result["reason"] = "size_within_limits"
+        # Logging formats lazily, only when DEBUG is enabled
+        logger.debug(
+            "Image %s (%.2fMB) approved for base64 encoding", image_path, size_mb
+        )
+        return result
+
+    except Exception as e:
+        result["reason"] = "error_checking_file"
+        result["error"] = f"Error checking image {image_path}: {str(e)}"
+        logger.error(result["error"], exc_info=True)
+        return result
+
 
 class ImageProcessingError(Exception):
     """Base exception for image processing errors."""
@@ -61,47 +432,55 @@ class ImageService:
             image_path: Path to the image file
 
         Returns:
-            Base64 data URI string (e.g., "data:image/jpeg;base64,...")
+            Base64 data URI string (e.g., "data:image/png;base64,...")
 
         Raises:
             Base64EncodingError: If encoding fails
             FileNotFoundError: If image file doesn't exist
+            ImageValidationError: If the file's contents are not a supported
+                image, whatever its extension
         """
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
-
         try:
-            # Determine MIME type based on file extension
-            extension = image_path.suffix.lower()
-            mime_type_map = {
-                ".jpg": "image/jpeg",
-                ".jpeg": "image/jpeg",
-                ".png": "image/png",
-                ".gif": "image/gif",
-                ".bmp": "image/bmp",
-                ".webp": "image/webp",
-            }
-
-            mime_type = mime_type_map.get(extension, "image/jpeg")
-
-            # Read and encode the image
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-                base64_string = base64.b64encode(image_data).decode("utf-8")
-
-            return f"data:{mime_type};base64,{base64_string}"
-
+            # The open itself reports a missing file; no separate exists() stat.
+            # The MIME type is detected from the header, as for should_use_base64.
+            return _encode_file_to_base64_streaming(image_path)
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image file not found: {image_path}") from None
+        except ImageValidationError:
+            raise
         except Exception as e:
             logger.error(f"Failed to encode image {image_path} to base64: {str(e)}")
             raise Base64EncodingError(f"Base64 encoding failed: {str(e)}", e) from e
 
     @staticmethod
-    def get_image_size_mb(image_path: Path) -> float:
+    def encode_bytes_to_base64(image_data: bytes, mime_type: str = "image/jpeg") -> str:
+        """
+        Convert encoded image bytes to a base64 data URI.
+
+        Args:
+            image_data: Encoded image bytes (e.g. JPEG)
+            mime_type: MIME type of the image data
+
+        Returns:
+            Base64 data URI string (e.g., "data:image/jpeg;base64,...")
+        """
+        if pybase64 is not None:
+            base64_string = pybase64.b64encode_as_string(image_data)
+        else:
+            base64_string = base64.b64encode(image_data).decode("ascii")
+        return f"data:{mime_type};base64,{base64_string}"
+
+    @staticmethod
+    def get_image_size_mb(
+        image_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> float:
         """
         Get the size of an image file in megabytes.
 
         Args:
             image_path: Path to the image file
+            stat_result: stat() of the file if the caller already has it
 
         Returns:
             Size in megabytes
@@ -109,11 +488,12 @@ class ImageService:
         Raises:
             FileNotFoundError: If image file doesn't exist
         """
-        if not image_path.exists():
+        if stat_result is None:
+            stat_result = _inspect(image_path)
+        if stat_result is None:
             raise FileNotFoundError(f"Image file not found: {image_path}")
 
-        size_bytes = image_path.stat().st_size
-        return size_bytes / (1024 * 1024)  # Convert to MB
+        return stat_result.st_size / (1024 * 1024)  # Convert to MB
 
     @staticmethod
     def should_use_base64(
@@ -122,6 +502,9 @@ class ImageService:
         """
         Determine if image should be base64 encoded with detailed reasoning.
 
+        Decisions are cached per (path, mtime, size), so repeated checks of an
+        unchanged file cost one stat() and skip the validation I/O.
+
         Args:
             image_path: Path to the image file
             force_fallback: If True, force fallback to URL format
@@ -135,51 +518,22 @@ class ImageService:
                 "error": Optional[str]
             }
         """
-        result = {
-            "use_base64": False,
-            "reason": "unknown",
-            "file_size_mb": 0.0,
-            "error": None,
-        }
-
+        # The path stays a str; Path objects would only add pathlib overhead
+        path_str = os.fspath(image_path)
         try:
-            # Check if file exists and is valid
-            if not ImageService.validate_image_file(image_path):
-                result["reason"] = "invalid_file"
-                result["error"] = f"Image file {image_path} is not valid or accessible"
-                logger.error(result["error"])
-                return result
-
-            # Check file size
-            size_mb = ImageService.get_image_size_mb(image_path)
-            result["file_size_mb"] = size_mb
-
-            if force_fallback:
-                result["reason"] = "forced_fallback"
-                logger.info(f"Forced fallback to URL format for {image_path}")
-                return result
-
-            if size_mb > MAX_BASE64_IMAGE_SIZE_MB:
-                result["reason"] = "size_limit_exceeded"
-                logger.warning(
-                    f"Image {image_path} ({size_mb:.2f}MB) exceeds max base64 size "
-                    f"({MAX_BASE64_IMAGE_SIZE_MB}MB), falling back to URL format"
-                )
-                return result
-
-            # All checks passed
-            result["use_base64"] = True
-            result["reason"] = "size_within_limits"
-            logger.debug(
-                f"Image {image_path} ({size_mb:.2f}MB) approved for base64 encoding"
-            )
-            return result
-
-        except Exception as e:
-            result["reason"] = "error_checking_file"
-            result["error"] = f"Error checking image {image_path}: {str(e)}"
-            logger.error(result["error"], exc_info=True)
-            return result
+            stat_result = os.stat(path_str)
+        except OSError:
+            # Missing or unreadable files are not cached; report them as usual
+            return _base64_decision(path_str, None, force_fallback, None)
+
+        result, _ = _cached_base64_decision(
+            path_str,
+            stat_result,
+            force_fallback,
+            lambda: _probe_image_mime(path_str, stat_result.st_size),
+        )
+        # Callers get their own copy of the cached decision
+        return dict(result)
 
     @staticmethod
     def create_task_result_with_fallback(
@@ -200,65 +554,55 @@ class ImageService:
         Raises:
             ImageProcessingError: If both base64 and URL fallback fail
         """
-        fallback_attempts = []
+        # (step, reason) pairs, only formatted once every attempt has failed
+        fallback_attempts: List[Tuple[str, object]] = []
 
+        # First attempt: Try base64 encoding. The decision and the encoding
+        # share one open file; the decision reports its own errors.
         try:
-            # First attempt: Try base64 encoding
-            base64_decision = ImageService.should_use_base64(image_path)
-
-            if base64_decision["use_base64"]:
-                try:
-                    image_data = ImageService.encode_image_to_base64(image_path)
-                    logger.info(
-                        f"Successfully created base64 TaskResult for {image_path}"
-                    )
-                    return TaskResult(
-                        timestamp=timestamp, score=score, image_data=image_data
-                    )
-
-                except Base64EncodingError as e:
-                    fallback_attempts.append(f"Base64 encoding failed: {str(e)}")
-                    logger.warning(
-                        f"Base64 encoding failed for {image_path}, attempting URL fallback: {str(e)}"
-                    )
-
-                except Exception as e:
-                    fallback_attempts.append(f"Base64 processing error: {str(e)}")
-                    logger.warning(
-                        f"Unexpected error during base64 encoding for {image_path}: {str(e)}"
-                    )
-            else:
-                fallback_attempts.append(
-                    f"Base64 not suitable: {base64_decision['reason']}"
-                )
+            image_data, base64_decision = _encode_if_suitable(image_path)
+            if image_data is not None:
+                # Lazy %-formatting: the success path formats nothing when
+                # INFO logging is disabled
                 logger.info(
-                    f"Skipping base64 for {image_path}: {base64_decision['reason']}"
+                    "Successfully created base64 TaskResult for %s", image_path
                 )
-
-            # Fallback: Create URL-based result
-            try:
-                # For now, we only support base64, so we'll raise an error
-                # In a full implementation, this would create a URL-based TaskResult
-                error_details = "; ".join(fallback_attempts)
-                raise ImageProcessingError(
-                    f"Cannot create TaskResult for {image_path}. Base64 encoding failed and URL fallback not implemented. Details: {error_details}",
-                    "FALLBACK_FAILED",
+                return TaskResult(
+                    timestamp=timestamp, score=score, image_data=image_data
                 )
 
-            except Exception as e:
-                fallback_attempts.append(f"URL fallback failed: {str(e)}")
-                logger.error(f"URL fallback also failed for {image_path}: {str(e)}")
+            fallback_attempts.append(("Base64 not suitable", base64_decision["reason"]))
+            logger.info(
+                "Skipping base64 for %s: %s", image_path, base64_decision["reason"]
+            )
+
+        except Base64EncodingError as e:
+            fallback_attempts.append(("Base64 encoding failed", e))
+            logger.warning(
+                f"Base64 encoding failed for {image_path}, attempting URL fallback: {str(e)}"
+            )
 
         except Exception as e:
-            if not isinstance(e, ImageProcessingError):
-                fallback_attempts.append(f"Unexpected error: {str(e)}")
-                logger.error(
-                    f"Unexpected error in create_task_result_with_fallback for {image_path}: {str(e)}",
-                    exc_info=True,
-                )
+            fallback_attempts.append(("Base64 processing error", e))
+            logger.warning(
+                f"Unexpected error during base64 encoding for {image_path}: {str(e)}"
+            )
+
+        # Fallback: Create URL-based result
+        # For now, we only support base64, so the fallback always fails
+        # In a full implementation, this would create a URL-based TaskResult
+        error_details = _format_fallback_attempts(fallback_attempts)
+        fallback_error = ImageProcessingError(
+            f"Cannot create TaskResult for {image_path}. Base64 encoding failed and URL fallback not implemented. Details: {error_details}",
+            "FALLBACK_FAILED",
+        )
+        fallback_attempts.append(("URL fallback failed", fallback_error))
+        logger.error(
+            f"URL fallback also failed for {image_path}: {str(fallback_error)}"
+        )
 
         # If we reach here, all attempts failed
-        error_summary = "; ".join(fallback_attempts)
+        error_summary = _format_fallback_attempts(fallback_attempts)
         final_error = ImageProcessingError(
             f"All fallback attempts failed for {image_path}: {error_summary}",
             "ALL_FALLBACKS_FAILED",
@@ -266,6 +610,74 @@ class ImageService:
         logger.error(str(final_error))
         raise final_error
 
+    @staticmethod
+    async def create_task_result_with_fallback_async(
+        image_path: Path, timestamp: str, score: float, task_id: str = None
+    ) -> TaskResult:
+        """
+        Async version of create_task_result_with_fallback for event loop callers.
+
+        File checks and base64 encoding run on a worker thread, so encoding a
+        large image does not block the loop. Arguments, result and errors are
+        the same as for create_task_result_with_fallback.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _BASE64_EXECUTOR,
+            ImageService.create_task_result_with_fallback,
+            image_path,
+            timestamp,
+            score,
+            task_id,
+        )
+
+    @staticmethod
+    def create_task_result_from_bytes(
+        image_data,
+        timestamp: str,
+        score: float,
+        task_id: str = None,
+        mime_type: str = "image/jpeg",
+    ) -> TaskResult:
+        """
+        Create TaskResult from in-memory encoded image bytes without a temp file.
+
+        Args:
+            image_data: Encoded image bytes or any contiguous bytes-like object,
+                such as the buffer returned by cv2.imencode
+            timestamp: Timestamp string
+            score: Smile detection score
+            task_id: Task ID, used for logging (optional)
+            mime_type: MIME type of the image data
+
+        Returns:
+            TaskResult with base64 image data
+
+        Raises:
+            ImageValidationError: If image_data is empty
+            ImageSizeError: If the image exceeds MAX_BASE64_IMAGE_SIZE_MB
+            Base64EncodingError: If encoding fails
+        """
+        image_data = memoryview(image_data)
+        if not image_data.nbytes:
+            raise ImageValidationError(f"Image data for task {task_id} is empty")
+
+        size_mb = image_data.nbytes / (1024 * 1024)
+        if size_mb > MAX_BASE64_IMAGE_SIZE_MB:
+            raise ImageSizeError(
+                f"Image for task {task_id} ({size_mb:.2f}MB) exceeds max base64 size "
+                f"({MAX_BASE64_IMAGE_SIZE_MB}MB)",
+                size_mb,
+            )
+
+        try:
+            image_uri = ImageService.encode_bytes_to_base64(image_data, mime_type)
+        except Exception as e:
+            logger.error(f"Failed to encode image for task {task_id}: {str(e)}")
+            raise Base64EncodingError(f"Base64 encoding failed: {str(e)}", e) from e
+
+        return TaskResult(timestamp=timestamp, score=score, image_data=image_uri)
+
     @staticmethod
     def create_task_result(
         image_path: Path, timestamp: str, score: float
@@ -289,38 +701,32 @@ class ImageService:
         )
 
     @staticmethod
-    def validate_image_file(image_path: Path) -> bool:
+    def validate_image_file(
+        image_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> bool:
         """
         Validate that the file is a supported image format.
 
         Args:
             image_path: Path to the image file
+            stat_result: stat() of the file if the caller already has it
 
         Returns:
             True if file is a valid image, False otherwise
         """
         try:
-            if not image_path.exists():
-                return False
-
             # Check file extension
-            supported_extensions = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"}
-            if image_path.suffix.lower() not in supported_extensions:
+            if _extension(image_path) not in SUPPORTED_IMAGE_EXTENSIONS:
                 return False
 
-            # Basic file size check (not empty, not too large)
-            size_bytes = image_path.stat().st_size
-            if size_bytes == 0:
+            if stat_result is None:
+                stat_result = _inspect(image_path)
+            if stat_result is None:
                 return False
 
-            # Check if file is readable
-            try:
-                with open(image_path, "rb") as f:
-                    # Read first few bytes to ensure it's accessible
-                    f.read(10)
-                return True
-            except Exception:
-                return False
+            # Read the header to ensure the file is not empty, is accessible
+            # and is an image
+            return _probe_image_mime(image_path, stat_result.st_size) is not None
 
         except Exception as e:
             logger.error(f"Error validating image file {image_path}: {str(e)}")
@@ -337,41 +743,8 @@ class ImageService:
         Returns:
             Dict with user-friendly error information
         """
-        error_messages = {
-            "BASE64_ENCODING_ERROR": {
-                "message": "An error occurred while processing the image.",
-                "suggestion": "Try a different image or wait and retry later.",
-                "retryable": True,
-            },
-            "IMAGE_SIZE_ERROR": {
-                "message": f"The image file is too large (limit: {MAX_BASE64_IMAGE_SIZE_MB}MB).",
-                "suggestion": "Use a smaller image or compress the file.",
-                "retryable": False,
-            },
-            "IMAGE_VALIDATION_ERROR": {
-                "message": "The image format is not supported.",
-                "suggestion": "Use JPEG, PNG, GIF, BMP, or WebP image formats.",
-                "retryable": False,
-            },
-            "FALLBACK_FAILED": {
-                "message": "Image processing failed.",
-                "suggestion": "Check that the image file is not corrupted and try again.",
-                "retryable": True,
-            },
-            "ALL_FALLBACKS_FAILED": {
-                "message": "Unable to process the image.",
-                "suggestion": "Use another image or contact support.",
-                "retryable": False,
-            },
-        }
-
-        error_info = error_messages.get(
-            error.error_code,
-            {
-                "message": "An unexpected error occurred.",
-                "suggestion": "Wait a while and try again.",
-                "retryable": True,
-            },
+        error_info = USER_ERROR_MESSAGES.get(
+            error.error_code, DEFAULT_USER_ERROR_MESSAGE
         )
 
         return {
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Dict, Optional
 
 import redis
+from pydantic_core import from_json, to_json
 
 import config
 
@@ -17,6 +17,16 @@ class TaskNotFoundError(Exception):
     """Exception raised when the requested task does not exist."""
 
 
+# HSET only when the key exists, in one round trip. Returns 0 for a missing key.
+_HSET_IF_EXISTS_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("HSET", KEYS[1], unpack(ARGV))
+return 1
+"""
+
+
 class TaskRepository:
     """Repository for storing and retrieving task information in Redis."""
 
@@ -26,6 +36,7 @@ class TaskRepository:
         else:
             logger.info("Connecting to Redis at %s", config.REDIS_URL)
             self._redis = redis.from_url(config.REDIS_URL, decode_responses=True)
+        self._hset_if_exists = self._redis.register_script(_HSET_IF_EXISTS_SCRIPT)
 
     def create_task(self, task_id: str, payload: Dict[str, Any]) -> None:
         """Create a task and set its TTL."""
@@ -39,18 +50,13 @@ class TaskRepository:
     def update_task(self, task_id: str, payload: Dict[str, Any]) -> None:
         """Update task information."""
 
-        if not self._redis.exists(self._task_key(task_id)):
-            raise TaskNotFoundError(task_id)
-
-        self._redis.hset(self._task_key(task_id), mapping=payload)
+        self._hset_existing(task_id, payload)
 
     def append_task_results(self, task_id: str, results: Any) -> None:
         """Store task results as JSON."""
 
-        if not self._redis.exists(self._task_key(task_id)):
-            raise TaskNotFoundError(task_id)
-
-        self._redis.hset(self._task_key(task_id), "results", json.dumps(results))
+        # pydantic's Rust JSON codec is much faster than json on large base64 text
+        self._hset_existing(task_id, {"results": to_json(results)})
 
     def get_task(self, task_id: str) -> Dict[str, Any]:
         """Retrieve task information or raise TaskNotFoundError if missing."""
@@ -61,7 +67,7 @@ class TaskRepository:
 
         results_raw = data.get("results")
         if results_raw:
-            data["results"] = json.loads(results_raw)
+            data["results"] = from_json(results_raw)
 
         if "progress" in data:
             data["progress"] = int(data["progress"])
@@ -71,11 +77,23 @@ class TaskRepository:
 
         return data
 
+    def task_exists(self, task_id: str) -> bool:
+        """Check that a task has not expired or been deleted."""
+
+        return bool(self._redis.exists(self._task_key(task_id)))
+
     def delete_task(self, task_id: str) -> None:
         """Delete task information."""
 
         self._redis.delete(self._task_key(task_id))
 
+    def _hset_existing(self, task_id: str, mapping: Dict[str, Any]) -> None:
+        """HSET fields of an existing task; never recreates an expired one."""
+
+        fields = [item for field in mapping.items() for item in field]
+        if not self._hset_if_exists(keys=[self._task_key(task_id)], args=fields):
+            raise TaskNotFoundError(task_id)
+
     @staticmethod
     def _task_key(task_id: str) -> str:
         return f"tasks:{task_id}"
@@ -0,0 +1,116 @@
+import asyncio
+import random
+
+import pytest
+
+import routers
+
+
+@pytest.fixture
+def completed_task_cache(monkeypatch):
+    """An empty completed-task response cache with room for two 11-byte entries."""
+    monkeypatch.setattr(routers, "COMPLETED_TASK_CACHE_BYTES", 25)
+    monkeypatch.setattr(routers, "_completed_task_responses", routers.OrderedDict())
+    monkeypatch.setattr(routers, "_completed_task_cache_bytes", 0)
+    return routers._completed_task_responses
+
+
+def _poll_while(monkeypatch, task_id, concurrent_request):
+    """GET a cached task while `concurrent_request` runs during the expiry check."""
+
+    async def run_in_threadpool(func, *args):
+        concurrent_request()
+        return True
+
+    monkeypatch.setattr(routers, "run_in_threadpool", run_in_threadpool)
+    return asyncio.run(routers.get_task(task_id))
+
+
+def test_full_cache_hit_survives_concurrent_eviction(monkeypatch, completed_task_cache):
+    routers._cache_completed_task_response("a", b'{"a": 1234}')
+    routers._cache_completed_task_response("b", b'{"b": 1234}')
+
+    # Caching another response while "a" is polled evicts "a" to stay in budget
+    response = _poll_while(
+        monkeypatch,
+        "a",
+        lambda: routers._cache_completed_task_response("c", b'{"c": 1234}'),
+    )
+
+    assert response.status_code == 200
+    assert response.body == b'{"a": 1234}'
+    assert list(completed_task_cache) == ["b", "c"]
+    assert routers._completed_task_cache_bytes == 22
+
+
+def test_cache_hit_survives_concurrent_expiry(monkeypatch, completed_task_cache):
+    routers._cache_completed_task_response("a", b'{"a": 1234}')
+
+    response = _poll_while(
+        monkeypatch, "a", lambda: routers._evict_completed_task_response("a")
+    )
+
+    assert response.body == b'{"a": 1234}'
+    assert not completed_task_cache
+    assert routers._completed_task_cache_bytes == 0
+
+
+def test_oversized_response_is_not_cached(completed_task_cache):
+    routers._cache_completed_task_response("a", b"x" * 26)
+
+    assert not completed_task_cache
+    assert routers._completed_task_cache_bytes == 0
+
+
+def _select_incrementally(frames, max_pending_seconds=float("inf")):
+    selector = routers._DiverseSmileSelector(1.0, max_pending_seconds)
+    for timestamp, candidates in frames:
+        selector.add(candidates, timestamp)
+    return selector.finish()
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_selector_matches_select_diverse_candidates(seed):
+    rng = random.Random(seed)
+    frames = []
+    timestamp = 0.0
+    for frame_index in range(rng.randint(0, 150)):
+        timestamp = round(timestamp + rng.choice([0.1, 0.1, 0.2, 0.5, 1.0]), 4)
+        candidates = [
+            {
+                # Rounded scores make ties, broken by arrival order
+                "smile_score": round(rng.random(), rng.choice([1, 6])),
+                "timestamp": timestamp,
+                "id": (frame_index, face),
+            }
+            for face in range(rng.choice([0, 1, 1, 2, 3]))
+        ]
+        frames.append((timestamp, candidates))
+
+    every_candidate = [
+        candidate for _, candidates in frames for candidate in candidates
+    ]
+    every_candidate.sort(key=lambda candidate: candidate["smile_score"], reverse=True)
+    expected = routers.select_diverse_candidates(every_candidate, time_threshold=1.0)
+
+    assert _select_incrementally(frames) == expected
+
+
+def test_selector_bounds_a_rising_smile():
+    # Every frame scores higher than the one before, so none can be settled
+    # until the smile ends
+    frames = [
+        (index / 10, [{"smile_score": index / 2000, "timestamp": index / 10}])
+        for index in range(2000)
+    ]
+    selector = routers._DiverseSmileSelector(1.0, max_pending_seconds=5.0)
+    largest_open = 0
+    for timestamp, candidates in frames:
+        selector.add(candidates, timestamp)
+        largest_open = max(largest_open, len(selector._open))
+    selected = selector.finish()
+
+    assert largest_open <= 51
+    assert selected[0] is frames[-1][1][0]
+    times = sorted(candidate["timestamp"] for candidate in selected)
+    assert all(later - earlier > 0.5 for earlier, later in zip(times, times[1:]))
@@ -0,0 +1,105 @@
+import logging
+
+import cv2
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# ffmpegcv capture classes for each hardware decoder
+_FFMPEGCV_DECODERS = {
+    "qsv": "VideoCaptureQSV",
+    "nvidia": "VideoCaptureNV",
+}
+
+
+class FfmpegcvCapture(object):
+    """cv2.VideoCapture-compatible wrapper around an ffmpegcv hardware decoder.
+
+    ffmpegcv has no grab()/retrieve() split, so grab() decodes the frame on the
+    iGPU/GPU and retrieve() hands it out. Frames keep their full resolution
+    because the selected stills are cropped and exported from them.
+
+    When `fps` is given, ffmpeg drops frames down to that rate before they are
+    converted to BGR and piped over, and the capture reports the reduced rate
+    and frame count, so callers sample every frame it returns.
+    """
+
+    def __init__(self, cap, fps=None):
+        self.cap = cap
+        self.fps = cap.fps
+        self.count = cap.count
+        if fps and fps < cap.fps and self._limit_output_rate(fps):
+            self.count = int(cap.count * fps / cap.fps)
+            self.fps = fps
+        self._frame = None
+        self._frame_index = -1
+
+    def _limit_output_rate(self, fps):
+        # ffmpegcv builds the command up front and starts ffmpeg on the first
+        # read, with the source rate as the output rate of the raw video pipe
+        output_rate = f"-r {self.cap.fps} -f rawvideo"
+        if output_rate not in self.cap.ffmpeg_cmd:
+            return False
+        self.cap.ffmpeg_cmd = self.cap.ffmpeg_cmd.replace(
+            output_rate, f"-r {fps} -f rawvideo"
+        )
+        return True
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def grab(self):
+        ret, self._frame = self.cap.read()
+        if ret:
+            self._frame_index += 1
+        return ret
+
+    def retrieve(self):
+        return self._frame is not None, self._frame
+
+    def get(self, prop_id):
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return self.count
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return self._frame_index + 1
+        if prop_id == cv2.CAP_PROP_POS_MSEC:
+            return self._frame_index * 1000.0 / self.fps if self.fps else 0.0
+        return 0.0
+
+    def release(self):
+        self.cap.release()
+
+
+def open_video_capture(video_path, decoder=None, sample_fps=None):
+    """
+    Open a video file with the configured decoder.
+
+    Args:
+        video_path: Path to the video file
+        decoder: "opencv", "qsv" or "nvidia" (default: config.VIDEO_DECODER)
+        sample_fps: Frame rate the caller samples at. Hardware decoders only
+            return frames at this rate; OpenCV returns every frame.
+
+    Returns:
+        An object with the cv2.VideoCapture grab/retrieve/get/release API
+    """
+    if decoder is None:
+        decoder = config.VIDEO_DECODER
+
+    class_name = _FFMPEGCV_DECODERS.get(decoder)
+    if class_name is not None:
+        try:
+            import ffmpegcv
+
+            cap = getattr(ffmpegcv, class_name)(video_path, pix_fmt="bgr24")
+            logger.info(f"Decoding {video_path} with ffmpegcv.{class_name}")
+            return FfmpegcvCapture(cap, fps=sample_fps)
+        except Exception as ex:
+            logger.warning(
+                f"Hardware decoder {decoder} unavailable, falling back to OpenCV: {ex}"
+            )
+
+    return cv2.VideoCapture(video_path)